@@ -6,6 +6,7 @@ import logging
 import datetime
 import json
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the Python path
 base_dir = Path(__file__).resolve().parents[1]
@@ -31,19 +32,20 @@ def main():
     
     logger.info(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
     
-    # Test arXiv scraper
-    logger.info("Testing arXiv scraper...")
-    arxiv_papers = arxiv_scraper.scrape_arxiv(start_date, end_date, max_results=10)
-    logger.info(f"Found {len(arxiv_papers)} papers on arXiv")
+    # Test all scrapers in parallel
+    logger.info("Testing arXiv, bioRxiv and blog scrapers...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            'arxiv': executor.submit(arxiv_scraper.scrape_arxiv, start_date, end_date, max_results=10),
+            'biorxiv': executor.submit(biorxiv_scraper.scrape_biorxiv, start_date, end_date, max_papers=10),
+            'blog': executor.submit(blog_scraper.scrape_blogs, start_date, end_date, max_entries=10)
+        }
+        arxiv_papers = futures['arxiv'].result()
+        biorxiv_papers = futures['biorxiv'].result()
+        blog_entries = futures['blog'].result()
     
-    # Test bioRxiv scraper
-    logger.info("Testing bioRxiv scraper...")
-    biorxiv_papers = biorxiv_scraper.scrape_biorxiv(start_date, end_date, max_papers=10)
+    logger.info(f"Found {len(arxiv_papers)} papers on arXiv")
     logger.info(f"Found {len(biorxiv_papers)} papers on bioRxiv")
-    
-    # Test blog scraper
-    logger.info("Testing blog scraper...")
-    blog_entries = blog_scraper.scrape_blogs(start_date, end_date, max_entries=10)
     logger.info(f"Found {len(blog_entries)} blog entries")
     
     # Combine results
@@ -1,133 +1,332 @@
 import requests
 import json
-import time
+import re
+import os
+import hashlib
+import asyncio
 import logging
+from pathlib import Path
+
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive session for all synchronous requests to LM Studio
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # allowed_methods=None so the completions POSTs are retried too, not just GETs
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=None)
+))
+
+# Default number of LLM requests in flight at once; the best value depends on the local GPU
+MAX_CONCURRENT_QUERIES = 8
+
+# LM Studio generates one response at a time, so a queued request can wait many minutes for its
+# first byte; bound only connecting and each read instead of the whole request
+LLM_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=900)
+
+# Responses are cached on disk so re-runs skip entries that were already analyzed
+LLM_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "llm_cache.json"
+_llm_cache = None
+
+def _cache_key(prompt, model, temperature, system_prompt=None):
+    """Build the cache key for a prompt/model/temperature combination."""
+    return hashlib.sha256(f"{model}|{temperature}|{system_prompt or ''}|{prompt}".encode()).hexdigest()
+
+def load_llm_cache():
+    """Load the LLM response cache from disk (once per process)."""
+    global _llm_cache
+    if _llm_cache is None:
+        try:
+            with open(LLM_CACHE_PATH, 'r') as f:
+                _llm_cache = json.load(f)
+        except FileNotFoundError:
+            _llm_cache = {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache at {LLM_CACHE_PATH}: {e}")
+            _llm_cache = {}
+    return _llm_cache
+
+def save_llm_cache():
+    """Atomically write the LLM response cache to disk."""
+    if _llm_cache is None:
+        return
+    
+    os.makedirs(LLM_CACHE_PATH.parent, exist_ok=True)
+    tmp_path = LLM_CACHE_PATH.with_name(LLM_CACHE_PATH.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(_llm_cache, f)
+    os.replace(tmp_path, LLM_CACHE_PATH)
+
 def check_lm_studio_connection(base_url="http://localhost:1234"):
     """Check if LM Studio server is running."""
     try:
-        response = requests.get(base_url)
+        response = _session.get(base_url, timeout=5)
         logger.info(f"LM Studio connection successful: {response.status_code}")
         return True
-    except requests.exceptions.ConnectionError:
+    except requests.exceptions.RequestException:
         logger.error("Cannot connect to LM Studio server")
         return False
 
+def _build_messages(prompt, system_prompt=None):
+    """Build the chat messages, putting the fixed instructions first so LM Studio can reuse their KV cache."""
+    messages = [{"role": "user", "content": prompt}]
+    if system_prompt:
+        messages.insert(0, {"role": "system", "content": system_prompt})
+    return messages
+
+def _should_cache(choice, content, cacheable=None):
+    """Decide whether a response is worth replaying on later runs."""
+    # A truncated generation would be replayed as-is forever at temperature 0
+    if content is None or choice.get("finish_reason") == "length":
+        return False
+    return cacheable is None or cacheable(content)
+
 def query_lm_studio(prompt, api_url="http://localhost:1234/v1/chat/completions", 
-                   model="local-model", temperature=0.7, max_tokens=2048):
-    """Query the local LM Studio model."""
+                   model="local-model", temperature=0.0, max_tokens=512, use_cache=True,
+                   system_prompt=None, cacheable=None):
+    """
+    Query the local LM Studio model.
+    
+    New responses are only added to the in-memory cache; call save_llm_cache() once the
+    batch of queries is done to persist them. Responses cut off at max_tokens, or rejected
+    by the optional `cacheable` predicate, are returned but not cached.
+    """
+    if use_cache:
+        key = _cache_key(prompt, model, temperature, system_prompt)
+        cache = load_llm_cache()
+        if key in cache:
+            return cache[key]
+    
     headers = {
         "Content-Type": "application/json"
     }
     
     payload = {
         "model": model,
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": _build_messages(prompt, system_prompt),
         "temperature": temperature,
-        "max_tokens": max_tokens
+        "max_tokens": max_tokens,
+        "stop": ["\n\n\n"]  # Cut off runaway generations
     }
     
     try:
-        response = requests.post(api_url, headers=headers, data=json.dumps(payload))
+        # Same connect/read bounds as the async path, so a hung server can't block forever
+        response = _session.post(api_url, headers=headers, data=json.dumps(payload),
+                                 timeout=(LLM_REQUEST_TIMEOUT.sock_connect, LLM_REQUEST_TIMEOUT.sock_read))
         response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
-    except requests.exceptions.RequestException as e:
+        choice = response.json()["choices"][0]
+        content = choice["message"]["content"]
+    except (requests.exceptions.RequestException, ValueError, KeyError, IndexError) as e:
         logger.error(f"Error querying LM Studio: {e}")
         return None
-
-def summarize_entry(entry):
-    """Summarize a single research entry using LM Studio."""
-    template = """
-    Please provide a concise summary (3-5 sentences) of the following research paper:
     
-    Title: {title}
-    Authors: {authors}
-    Abstract: {abstract}
+    if use_cache and _should_cache(choice, content, cacheable):
+        cache[key] = content
+    return content
+
+async def aquery_lm_studio(session, prompt, api_url="http://localhost:1234/v1/chat/completions",
+                           model="local-model", temperature=0.0, max_tokens=512, use_cache=True,
+                           system_prompt=None, cacheable=None):
+    """Query the local LM Studio model asynchronously using a shared aiohttp session.
     
-    Focus on the key findings and contributions.
+    Caching works as in query_lm_studio.
     """
+    if use_cache:
+        key = _cache_key(prompt, model, temperature, system_prompt)
+        cache = load_llm_cache()
+        if key in cache:
+            return cache[key]
+    
+    payload = {
+        "model": model,
+        "messages": _build_messages(prompt, system_prompt),
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "stop": ["\n\n\n"]  # Cut off runaway generations
+    }
+    
+    try:
+        async with session.post(api_url, json=payload) as response:
+            response.raise_for_status()
+            data = await response.json()
+            choice = data["choices"][0]
+            content = choice["message"]["content"]
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError, IndexError) as e:
+        logger.error(f"Error querying LM Studio: {e}")
+        return None
     
-    prompt = template.format(
-        title=entry.get('title', ''),
-        authors=entry.get('authors', ''),
-        abstract=entry.get('abstract', '')
+    if use_cache and _should_cache(choice, content, cacheable):
+        # Persisted once by process_scraped_entries after all queries finish
+        cache[key] = content
+    return content
+
+# Generation budget for the fused prompt: summary (~256) + assessment (~200) + analysis (~700) tokens
+FUSED_MAX_TOKENS = 1200
+
+# The instructions are kept byte-identical across entries and sent first, with the
+# entry data appended last, so LM Studio can reuse the KV cache of the shared prefix.
+SUMMARY_SYSTEM_PROMPT = """You are an expert reviewer of machine learning and computational biology research.
+Please provide a concise summary (3-5 sentences) of the research paper given by the user.
+Focus on the key findings and contributions."""
+
+ASSESSMENT_SYSTEM_PROMPT = """You are an expert reviewer of machine learning and computational biology research.
+Please assess the quality and novelty of the research paper given by the user.
+
+Provide:
+1. Quality rating (1-5 stars, where 5 is highest quality)
+2. Novelty rating (1-5 stars, where 5 is most novel)
+3. Brief justification for your ratings (2-3 sentences)"""
+
+ANALYSIS_SYSTEM_PROMPT = """You are an expert reviewer of machine learning and computational biology research.
+Please analyze the research paper given by the user.
+
+Provide:
+1. A concise summary (3-5 sentences)
+2. Main contributions and innovations
+3. Significance and potential impact (rate from 1-5 where 5 is highest)
+4. Relevance to mechanistic interpretability (if applicable)
+5. Limitations or potential flaws
+
+Keep your analysis objective and focus on the technical merits."""
+
+FUSED_SYSTEM_PROMPT = """You are an expert reviewer of machine learning and computational biology research.
+Please analyze the research paper given by the user.
+
+Provide:
+- summary: a concise summary (3-5 sentences) focusing on the key findings and contributions
+- assessment: a quality rating (1-5 stars), a novelty rating (1-5 stars) and a brief
+  justification for your ratings (2-3 sentences)
+- full_analysis: main contributions and innovations, significance and potential impact
+  (rate from 1-5 where 5 is highest), relevance to mechanistic interpretability (if applicable),
+  and limitations or potential flaws
+
+Keep your analysis objective and focus on the technical merits.
+
+Respond with a strict JSON object: {"summary": ..., "assessment": ..., "full_analysis": ...}"""
+
+def build_entry_prompt(entry, include_url=False):
+    """Build the variable part of a prompt: the entry's title, authors and abstract."""
+    prompt = (
+        f"Title: {entry.get('title', '')}\n"
+        f"Authors: {entry.get('authors', '')}\n"
+        f"Abstract: {entry.get('abstract', '')}"
     )
+    if include_url:
+        prompt += f"\nURL: {entry.get('url', '')}"
+    return prompt
+
+def _extract_json_object(content):
+    """Return the JSON object in an LLM response, or None if it doesn't contain one."""
+    try:
+        result = json.loads(content)
+    except json.JSONDecodeError:
+        # Models often wrap the JSON in prose or code fences; extract the first {...} block
+        match = re.search(r'\{.*\}', content, re.DOTALL)
+        if not match:
+            return None
+        try:
+            result = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return None
+    
+    return result if isinstance(result, dict) else None
+
+def _has_json_object(content):
+    """Check whether a fused prompt response holds a JSON object, so it is worth caching."""
+    return _extract_json_object(content) is not None
+
+def parse_fused_response(content):
+    """Parse the JSON object returned for a fused prompt."""
+    if content is None:
+        return {}
     
-    return query_lm_studio(prompt)
+    result = _extract_json_object(content)
+    if result is None:
+        logger.warning("Could not parse a JSON object from the LLM response")
+        return {'full_analysis': content}
+    return result
+
+def apply_fused_analysis(entry, content):
+    """Assign the summary, assessment and full analysis parsed from a fused response."""
+    result = parse_fused_response(content)
+    entry['summary'] = result.get('summary')
+    entry['assessment'] = result.get('assessment')
+    entry['full_analysis'] = result.get('full_analysis')
+    return entry
+
+def analyze_entry_fused(entry):
+    """Analyze a research entry with a single fused LLM call."""
+    content = query_lm_studio(build_entry_prompt(entry, include_url=True), max_tokens=FUSED_MAX_TOKENS,
+                              system_prompt=FUSED_SYSTEM_PROMPT, cacheable=_has_json_object)
+    return apply_fused_analysis(entry, content)
+
+def summarize_entry(entry):
+    """Summarize a single research entry using LM Studio."""
+    return query_lm_studio(build_entry_prompt(entry), max_tokens=256, system_prompt=SUMMARY_SYSTEM_PROMPT)
 
 def assess_quality_and_novelty(entry):
     """Assess the quality and novelty of a research entry."""
-    template = """
-    Please assess the quality and novelty of the following research paper:
+    return query_lm_studio(build_entry_prompt(entry), max_tokens=200, system_prompt=ASSESSMENT_SYSTEM_PROMPT)
+
+def analyze_paper(paper):
+    """Comprehensive analysis of a single paper with the LLM."""
+    return query_lm_studio(build_entry_prompt(paper, include_url=True), max_tokens=700,
+                           system_prompt=ANALYSIS_SYSTEM_PROMPT)
+
+async def _analyze_entry_async(session, semaphore, entry, prompt, use_cache=True):
+    """Run the fused analysis prompt for one entry, bounded by the shared semaphore."""
+    async with semaphore:
+        logger.info(f"Processing entry: {entry.get('title', 'Untitled')}")
+        content = await aquery_lm_studio(session, prompt, max_tokens=FUSED_MAX_TOKENS, use_cache=use_cache,
+                                         system_prompt=FUSED_SYSTEM_PROMPT, cacheable=_has_json_object)
     
-    Title: {title}
-    Authors: {authors}
-    Abstract: {abstract}
+    return apply_fused_analysis(entry, content)
+
+async def _process_async(entries, use_cache=True, concurrency=MAX_CONCURRENT_QUERIES):
+    """Analyze all entries concurrently against LM Studio."""
+    # The semaphore replaces the old per-entry sleep as the rate limiter
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
     
-    Provide:
-    1. Quality rating (1-5 stars, where 5 is highest quality)
-    2. Novelty rating (1-5 stars, where 5 is most novel)
-    3. Brief justification for your ratings (2-3 sentences)
-    """
+    # Send the longest prompts first so the server sizes its KV buffer once
+    prompts = [(entry, build_entry_prompt(entry, include_url=True)) for entry in entries]
+    prompts.sort(key=lambda item: len(item[1]), reverse=True)
     
-    prompt = template.format(
-        title=entry.get('title', ''),
-        authors=entry.get('authors', ''),
-        abstract=entry.get('abstract', '')
-    )
+    async with aiohttp.ClientSession(connector=connector, timeout=LLM_REQUEST_TIMEOUT) as session:
+        tasks = [_analyze_entry_async(session, semaphore, entry, prompt, use_cache) for entry, prompt in prompts]
+        await asyncio.gather(*tasks)
     
-    return query_lm_studio(prompt)
+    # Entries are updated in place, so return them in their original order
+    return list(entries)
 
-def analyze_paper(paper):
-    """Comprehensive analysis of a single paper with the LLM."""
-    template = """
-    Please analyze the following research paper:
-    
-    Title: {title}
-    Authors: {authors}
-    Abstract: {abstract}
-    URL: {url}
-    
-    Provide:
-    1. A concise summary (3-5 sentences)
-    2. Main contributions and innovations
-    3. Significance and potential impact (rate from 1-5 where 5 is highest)
-    4. Relevance to mechanistic interpretability (if applicable)
-    5. Limitations or potential flaws
-    
-    Keep your analysis objective and focus on the technical merits.
+def process_scraped_entries(entries, use_cache=True, concurrency=MAX_CONCURRENT_QUERIES):
     """
+    Process the scraped entries, analyzing each one with the LLM.
     
-    prompt = template.format(
-        title=paper.get('title', ''),
-        authors=paper.get('authors', ''),
-        abstract=paper.get('abstract', ''),
-        url=paper.get('url', '')
-    )
-    
-    return query_lm_studio(prompt)
-
-def process_scraped_entries(entries):
-    """Process the scraped entries, analyzing each one with the LLM."""
+    Args:
+        entries (list): Scraped entries to analyze
+        use_cache (bool): Reuse and store responses in the on-disk LLM cache
+        concurrency (int): Number of entries analyzed by LM Studio at the same time
+        
+    Returns:
+        list: The entries with summary, assessment and full_analysis added
+    """
     if not check_lm_studio_connection():
         logger.error("Cannot proceed with analysis: LM Studio not available")
         return entries  # Return unanalyzed entries
     
-    processed_entries = []
-    for entry in entries:
-        logger.info(f"Processing entry: {entry.get('title', 'Untitled')}")
-        
-        # Add analysis to the entry
-        entry['summary'] = summarize_entry(entry)
-        entry['assessment'] = assess_quality_and_novelty(entry)
-        entry['full_analysis'] = analyze_paper(entry)
-        
-        processed_entries.append(entry)
-        time.sleep(1)  # Prevent overloading the LLM server
-    
-    return processed_entries
+    try:
+        return asyncio.run(_process_async(entries, use_cache, concurrency))
+    finally:
+        # Keep the responses gathered so far even if the run is interrupted
+        if use_cache:
+            save_llm_cache()
 
 def analyze_papers(papers):
     """Legacy function to maintain API compatibility."""
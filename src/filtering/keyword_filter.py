@@ -1,17 +1,48 @@
-def filter_entries_by_keywords(entries, keywords):
-    filtered_entries = []
-    for entry in entries:
-        if any(keyword.lower() in entry['title'].lower() or keyword.lower() in entry['abstract'].lower() for keyword in keywords):
-            filtered_entries.append(entry)
-    return filtered_entries
+import re
+
+from utils.fastjson import dumps, loads
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to a compiled regex
+    ahocorasick = None
+
+def _build_automaton(keywords):
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+def compile_keyword_pattern(keywords):
+    """Compile keywords into one case-insensitive alternation that can be shared across callers."""
+    if not keywords:
+        return re.compile(r'(?!)')  # Never matches, like any() over no keywords
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+def filter_entries_by_keywords(entries, keywords_or_pattern):
+    if isinstance(keywords_or_pattern, re.Pattern):
+        pattern = keywords_or_pattern
+    elif ahocorasick is not None and keywords_or_pattern:
+        # One automaton scan per entry instead of one substring scan per keyword
+        automaton = _build_automaton(keywords_or_pattern)
+        filtered_entries = []
+        for entry in entries:
+            # Lowercase each field once; the abstract is only scanned if the title has no match
+            if next(automaton.iter(entry['title'].lower()), None) is not None \
+                    or next(automaton.iter(entry['abstract'].lower()), None) is not None:
+                filtered_entries.append(entry)
+        return filtered_entries
+    else:
+        pattern = compile_keyword_pattern(keywords_or_pattern)
+
+    return [entry for entry in entries if pattern.search(entry['title']) or pattern.search(entry['abstract'])]
 
 def load_keywords_from_config(config_path):
-    import json
-    with open(config_path, 'r') as file:
-        config = json.load(file)
+    with open(config_path, 'rb') as file:
+        config = loads(file.read())
     return config.get('keywords', [])
 
 def save_filtered_entries(filtered_entries, output_path):
-    import json
-    with open(output_path, 'w') as file:
-        json.dump(filtered_entries, file, indent=4)
\ No newline at end of file
+    with open(output_path, 'wb') as file:
+        file.write(dumps(filtered_entries))
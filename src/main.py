@@ -4,9 +4,9 @@ import sys
 import os
 import logging
 import datetime
-import json
 import argparse
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the Python path
 base_dir = Path(__file__).resolve().parents[1]
@@ -14,6 +14,8 @@ sys.path.append(str(base_dir / "src"))
 
 # Import the scrapers
 from scrapers import arxiv_scraper, biorxiv_scraper, blog_scraper
+from utils.fastjson import dumps
+from utils.helpers import dedupe_entries
 
 # Set up logging
 logging.basicConfig(
@@ -78,23 +80,27 @@ def main():
     logger.info(f"Generating {interval_name} Digest")
     logger.info(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
     
-    # Run arXiv scraper
-    logger.info("Scraping arXiv...")
-    arxiv_papers = arxiv_scraper.scrape_arxiv(start_date, end_date, max_results=args.max_papers)
-    logger.info(f"Found {len(arxiv_papers)} papers on arXiv")
+    # Run the scrapers in parallel - they hit independent hosts and are I/O-bound
+    logger.info("Scraping arXiv, bioRxiv and research blogs...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            'arxiv': executor.submit(arxiv_scraper.scrape_arxiv, start_date, end_date, max_results=args.max_papers),
+            'biorxiv': executor.submit(biorxiv_scraper.scrape_biorxiv, start_date, end_date, max_papers=args.max_papers),
+            'blog': executor.submit(blog_scraper.scrape_blogs, start_date, end_date, max_entries=args.max_papers)
+        }
+        arxiv_papers = futures['arxiv'].result()
+        biorxiv_papers = futures['biorxiv'].result()
+        blog_entries = futures['blog'].result()
     
-    # Run bioRxiv scraper
-    logger.info("Scraping bioRxiv...")
-    biorxiv_papers = biorxiv_scraper.scrape_biorxiv(start_date, end_date, max_papers=args.max_papers)
+    logger.info(f"Found {len(arxiv_papers)} papers on arXiv")
     logger.info(f"Found {len(biorxiv_papers)} papers on bioRxiv")
-    
-    # Run blog scraper
-    logger.info("Scraping research blogs...")
-    blog_entries = blog_scraper.scrape_blogs(start_date, end_date, max_entries=args.max_papers)
     logger.info(f"Found {len(blog_entries)} blog entries")
     
-    # Combine results
+    # Combine results, dropping preprints cross-posted to several sources
     all_content = arxiv_papers + biorxiv_papers + blog_entries
+    unique_content = dedupe_entries(all_content)
+    logger.info(f"Removed {len(all_content) - len(unique_content)} duplicate entries")
+    all_content = unique_content
     logger.info(f"Total content found: {len(all_content)}")
     
     # Save results
@@ -119,8 +125,8 @@ def main():
         "entries": all_content
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(digest_data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(dumps(digest_data))
     
     logger.info(f"Digest saved to {output_file}")
     logger.info("Digest generation completed")
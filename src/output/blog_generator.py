@@ -1,5 +1,19 @@
 # blog_generator.py
 
+def _blog_post_parts(summarized_entries):
+    """Yield the blog post as a sequence of string fragments."""
+    yield "# Weekly Research Digest\n\n"
+    yield "## Summary of New Research Works\n\n"
+    
+    for entry in summarized_entries:
+        yield (
+            f"### {entry['title']}\n"
+            f"**Authors:** {', '.join(entry['authors'])}\n"
+            f"**Summary:** {entry['summary']}\n"
+            f"**Quality Assessment:** {entry['quality']}\n"
+            f"**Link:** [Read more]({entry['link']})\n\n"
+        )
+
 def generate_blog_post(summarized_entries):
     """
     Generate a blog post from the summarized entries.
@@ -10,17 +24,18 @@ def generate_blog_post(summarized_entries):
     Returns:
         str: A formatted blog post as a string.
     """
-    blog_content = "# Weekly Research Digest\n\n"
-    blog_content += "## Summary of New Research Works\n\n"
-    
-    for entry in summarized_entries:
-        blog_content += f"### {entry['title']}\n"
-        blog_content += f"**Authors:** {', '.join(entry['authors'])}\n"
-        blog_content += f"**Summary:** {entry['summary']}\n"
-        blog_content += f"**Quality Assessment:** {entry['quality']}\n"
-        blog_content += f"**Link:** [Read more]({entry['link']})\n\n"
+    return "".join(_blog_post_parts(summarized_entries))
+
+def write_blog_post(summarized_entries, file_path):
+    """
+    Generate a blog post from the summarized entries and write it straight to a file.
     
-    return blog_content
+    Args:
+        summarized_entries (list): A list of summarized research entries.
+        file_path (str): The path where the blog post will be saved.
+    """
+    with open(file_path, 'w') as file:
+        file.writelines(_blog_post_parts(summarized_entries))
 
 def save_blog_post_to_file(blog_content, file_path):
     """
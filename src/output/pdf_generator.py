@@ -1,32 +1,29 @@
 # This file contains functions to generate a PDF from the summarized entries.
 
-from fpdf import FPDF
+from xml.sax.saxutils import escape
+
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+def _to_paragraph_markup(text):
+    # Paragraph parses a small XML markup, so escape the text and keep line breaks
+    return escape(text).replace('\n', '<br/>')
+
+def create_pdf(title, summaries, output_path):
+    doc = SimpleDocTemplate(output_path)
+    styles = getSampleStyleSheet()
+    flowables = [Paragraph(_to_paragraph_markup(title), styles['Title']), Spacer(1, 12)]
+    for summary in summaries:
+        flowables.append(Paragraph(_to_paragraph_markup(summary), styles['BodyText']))
+        flowables.append(Spacer(1, 6))
+    doc.build(flowables)
 
 class PDFGenerator:
+    """Compatibility wrapper around create_pdf for code that used the old FPDF-based class."""
+
     def __init__(self, title, summaries):
         self.title = title
         self.summaries = summaries
-        self.pdf = FPDF()
-        self.pdf.set_auto_page_break(auto=True, margin=15)
-        self.pdf.add_page()
-        self.pdf.set_font("Arial", size=12)
-
-    def add_title(self):
-        self.pdf.set_font("Arial", 'B', 16)
-        self.pdf.cell(0, 10, self.title, ln=True, align='C')
-        self.pdf.ln(10)
-
-    def add_summary(self, summary):
-        self.pdf.set_font("Arial", size=12)
-        self.pdf.multi_cell(0, 10, summary)
-        self.pdf.ln(5)
 
     def generate_pdf(self, output_path):
-        self.add_title()
-        for summary in self.summaries:
-            self.add_summary(summary)
-        self.pdf.output(output_path)
-
-def create_pdf(title, summaries, output_path):
-    pdf_generator = PDFGenerator(title, summaries)
-    pdf_generator.generate_pdf(output_path)
\ No newline at end of file
+        create_pdf(self.title, self.summaries, output_path)
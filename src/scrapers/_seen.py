@@ -0,0 +1,28 @@
+"""On-disk index of already formatted papers, keyed by their source ID."""
+
+import os
+import json
+import logging
+
+from utils.fastjson import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+def load_seen(path):
+    """Load the index of formatted papers, returning an empty dict if it is missing or unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            return loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable seen-paper cache at {path}: {e}")
+        return {}
+
+def save_seen(path, seen):
+    """Atomically write the index of formatted papers."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps(seen))
+    os.replace(tmp_path, path)
@@ -1,12 +1,39 @@
-import arxiv
+import asyncio
 import logging
 import json
 import os
+import sys
+import re
 import datetime
 from pathlib import Path
 
+import aiohttp
+import feedparser
+
+if __name__ == "__main__":
+    # Run as a script: add the src directory to the Python path, as main.py does
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.fastjson import dumps
+from scrapers._seen import load_seen, save_seen
+
 logger = logging.getLogger(__name__)
 
+# arXiv export API (Atom feed)
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_PAGE_SIZE = 100
+
+# Maximum number of concurrent requests to export.arxiv.org
+MAX_CONCURRENT_REQUESTS = 3
+
+# arXiv asks API clients to make at most one request every 3 seconds
+ARXIV_REQUEST_INTERVAL = 3.0
+
+# Failed requests and empty pages (which the arXiv API returns intermittently) are retried
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 def load_config(config_path):
     """Load configuration from a JSON file."""
     try:
@@ -30,63 +57,144 @@ def get_search_query(keywords):
     
     return f"({positive_terms}) {negative_terms}"
 
-def format_paper(paper):
-    """Format an arXiv paper into a standardized dictionary."""
+# Resolved once at import instead of on every scrape
+_BASE_DIR = Path(__file__).resolve().parents[2]  # Go back two directories to root
+_KEYWORDS_PATH = _BASE_DIR / "config" / "keywords.json"
+_KEYWORDS = load_config(_KEYWORDS_PATH)
+_SEARCH_QUERY = get_search_query(_KEYWORDS)
+
+def _feed_datetime(parsed_time):
+    """Convert a feedparser UTC struct_time into a timezone-aware datetime."""
+    return datetime.datetime(*parsed_time[:6], tzinfo=datetime.timezone.utc)
+
+def format_paper_from_feed(entry):
+    """Format an arXiv Atom feed entry into a standardized dictionary."""
+    pdf_urls = [link.get('href', '') for link in entry.get('links', []) if link.get('title') == 'pdf']
     return {
-        'title': paper.title,
-        'authors': ", ".join([author.name for author in paper.authors]),
-        'abstract': paper.summary,
-        'url': paper.entry_id,
-        'pdf_url': paper.pdf_url,
-        'published': paper.published.isoformat(),
-        'updated': paper.updated.isoformat(),
-        'categories': paper.categories,
+        'title': re.sub(r'\s+', ' ', entry.get('title', '')),
+        'authors': ", ".join(author.get('name', '') for author in entry.get('authors', [])),
+        'abstract': entry.get('summary', ''),
+        'url': entry.get('id', ''),
+        'pdf_url': pdf_urls[0] if pdf_urls else '',
+        'published': _feed_datetime(entry.published_parsed).isoformat(),
+        'updated': _feed_datetime(entry.updated_parsed).isoformat(),
+        'categories': [tag.get('term') for tag in entry.get('tags', [])],
         'source': 'arxiv'
     }
 
+class _RequestPacer:
+    """Spaces out the start of requests by a fixed interval across concurrent tasks."""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_start = 0.0
+    
+    async def wait(self):
+        """Sleep until this caller's request slot comes up."""
+        now = asyncio.get_running_loop().time()
+        # Reserve the slot before sleeping (no await in between) so concurrent tasks queue up behind each other
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+async def _afetch_page(session, semaphore, pacer, params):
+    """Fetch and parse a single page of the arXiv Atom feed, returning its entries ([] on failure)."""
+    async with semaphore:
+        logger.info(f"Requesting arXiv results {params['start']}-{params['start'] + params['max_results']}")
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            await pacer.wait()
+            try:
+                async with session.get(ARXIV_API_URL, params=params) as response:
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        logger.warning(f"Got {response.status} from arXiv, retrying results from {params['start']}")
+                        continue
+                    response.raise_for_status()
+                    text = await response.text()
+            except aiohttp.ClientResponseError as e:
+                # Retryable statuses were handled above, so this one won't succeed on retry
+                logger.error(f"Request failed: {e}")
+                return []
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < MAX_RETRIES:
+                    logger.warning(f"Request failed, retrying: {e}")
+                    continue
+                logger.error(f"Request failed: {e}")
+                return []
+            
+            feed = feedparser.parse(text)
+            # An empty page before the end of the results is a transient arXiv failure
+            total_results = int(feed.feed.get('opensearch_totalresults', 0) or 0)
+            if feed.entries or params['start'] >= total_results or attempt == MAX_RETRIES:
+                return feed.entries
+            logger.warning(f"arXiv returned an empty page for results from {params['start']}, retrying")
+
+async def _afetch_arxiv(query, total, page=ARXIV_PAGE_SIZE):
+    """Fetch up to `total` results for `query`, newest first, requesting all pages concurrently."""
+    # Requests start at least ARXIV_REQUEST_INTERVAL apart; the semaphore caps how many are in flight
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    pacer = _RequestPacer(ARXIV_REQUEST_INTERVAL)
+    timeout = aiohttp.ClientTimeout(total=60)
+    
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        pages = await asyncio.gather(*(
+            _afetch_page(session, semaphore, pacer, {
+                'search_query': query,
+                'start': start,
+                'max_results': min(page, total - start),
+                'sortBy': 'submittedDate',
+                'sortOrder': 'descending'
+            })
+            for start in range(0, total, page)
+        ))
+    
+    return [entry for page_entries in pages for entry in page_entries]
+
 def scrape_arxiv(start_date, end_date, max_results=50):
     """
     Scrape arXiv for papers published between start_date and end_date.
     """
     try:
-        # Load keywords from config
-        base_dir = Path(__file__).resolve().parents[2]  # Go back two directories to root
-        keywords_path = base_dir / "config" / "keywords.json"
+        base_dir = _BASE_DIR
         
         # Print debug info
-        logger.info(f"Looking for config at: {keywords_path}")
-        
-        keywords = load_config(keywords_path)
+        logger.info(f"Using keywords from: {_KEYWORDS_PATH}")
         
         # Debug: Use simpler search for testing
-        search_query = get_search_query(keywords)
+        search_query = _SEARCH_QUERY
         logger.info(f"Using search query: {search_query}")
         
         # Use a simpler date filter - just get recent papers  
         # Instead of using the date filter which can be tricky, just sort by recent
-        client = arxiv.Client(page_size=100, delay_seconds=3)
-        
-        search = arxiv.Search(
-            query=search_query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate
-        )
-        
-        # Execute the search
-        results = list(client.results(search))
+        results = asyncio.run(_afetch_arxiv(search_query, max_results))
         logger.info(f"Found {len(results)} papers on arXiv")
         
-        # Now filter by date after getting results
+        # Filter by date. Results are sorted newest first, so the first paper
+        # older than start_date ends the scan.
         filtered_results = []
         for paper in results:
-            published_date = paper.published.replace(tzinfo=None)  # Remove timezone for comparison
-            if start_date <= published_date <= end_date:
-                filtered_results.append(paper)
+            published_date = _feed_datetime(paper.published_parsed).replace(tzinfo=None)  # Remove timezone for comparison
+            if published_date > end_date:
+                continue
+            if published_date < start_date:
+                break
+            filtered_results.append(paper)
+            if len(filtered_results) >= max_results:
+                break
         
         logger.info(f"After date filtering: {len(filtered_results)} papers")
         
-        # Format the results
-        papers = [format_paper(paper) for paper in filtered_results]
+        # Format the results, reusing papers already formatted by the previous run.
+        # Only this run's papers are kept so the index stays the size of one window.
+        seen_path = base_dir / "data" / "cache" / "seen_arxiv.json"
+        seen = load_seen(seen_path)
+        current = {}
+        for paper in filtered_results:
+            current[paper.id] = seen.get(paper.id) or format_paper_from_feed(paper)
+        papers = list(current.values())
+        save_seen(seen_path, current)
         
         raw_data_dir = base_dir / "data" / "raw"
         # Check if 'raw' exists and is not a directory
@@ -98,8 +206,8 @@ def scrape_arxiv(start_date, end_date, max_results=50):
         os.makedirs(raw_data_dir, exist_ok=True)
         
         output_file = raw_data_dir / f"arxiv_{start_date.strftime('%Y%m%d')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(papers, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(dumps(papers))
         logger.info(f"Saved {len(papers)} papers to {output_file}")
             
         return papers
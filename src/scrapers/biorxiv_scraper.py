@@ -1,13 +1,40 @@
-import requests
+import asyncio
 import logging
 import json
 import os
+import sys
 import datetime
 from pathlib import Path
-import time
+
+import aiohttp
+
+if __name__ == "__main__":
+    # Run as a script: add the src directory to the Python path, as main.py does
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from filtering.keyword_filter import compile_keyword_pattern
+from utils.fastjson import dumps, loads
+from scrapers._seen import load_seen, save_seen
 
 logger = logging.getLogger(__name__)
 
+# bioRxiv serves at most 100 papers per cursor page
+BIORXIV_PAGE_SIZE = 100
+
+# Maximum number of concurrent requests to api.biorxiv.org
+MAX_CONCURRENT_REQUESTS = 4
+
+# Most cursor pages read per scrape, however few papers match the keywords
+MAX_PAGES = 20
+
+# Pause in seconds between batches of concurrent page requests
+BATCH_INTERVAL = 1.0
+
+# Retry policy for transient API failures
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 def load_config(config_path):
     """Load configuration from a JSON file."""
     try:
@@ -17,15 +44,26 @@ def load_config(config_path):
         logger.error(f"Error loading config from {config_path}: {e}")
         return {}
 
-def keyword_matches(text, keywords):
-    """Check if any keywords match the given text."""
+def get_keyword_pattern(keywords):
+    """Compile the positive ML and biology terms into a single regex."""
     ml_terms = keywords.get('ml_terms', [])
     biology_terms = keywords.get('biology_terms', [])
-    all_terms = ml_terms + biology_terms
+    return compile_keyword_pattern(ml_terms + biology_terms)
+
+# Resolved once at import instead of on every scrape
+_BASE_DIR = Path(__file__).resolve().parents[2]
+_KEYWORDS = load_config(_BASE_DIR / "config" / "keywords.json")
+_KEYWORD_PATTERN = get_keyword_pattern(_KEYWORDS) if _KEYWORDS else None
+
+def keyword_matches(text, pattern):
+    """Check if any keywords match the given text.
     
-    # Check if any positive terms match
-    text_lower = text.lower()
-    return any(term.lower() in text_lower for term in all_terms)
+    `pattern` is the compiled regex from get_keyword_pattern; a keywords dict
+    is also accepted and compiled on the fly.
+    """
+    if isinstance(pattern, dict):
+        pattern = get_keyword_pattern(pattern)
+    return pattern.search(text) is not None
 
 def format_paper(paper_data):
     """Format bioRxiv paper data into a standardized dictionary."""
@@ -40,78 +78,152 @@ def format_paper(paper_data):
         'source': 'biorxiv'
     }
 
-def fetch_biorxiv_papers(api_url, start_str, end_str, max_papers=50):
-    """Helper function to fetch papers from bioRxiv API."""
+async def _afetch_page(session, semaphore, full_url):
+    """Fetch and decode a single bioRxiv API page, returning None on failure."""
+    async with semaphore:
+        logger.info(f"Requesting: {full_url}")
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(full_url) as response:
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        logger.warning(f"Got {response.status} from bioRxiv, retrying: {full_url}")
+                        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                        continue
+                    response.raise_for_status()  # Raise exception on 4xx/5xx responses
+                    body = await response.read()
+                    break
+            except aiohttp.ClientResponseError as e:
+                # Retryable statuses were handled above, so this one won't succeed on retry
+                logger.error(f"Request failed: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < MAX_RETRIES:
+                    logger.warning(f"Request failed, retrying: {e}")
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                logger.error(f"Request failed: {e}")
+                return None
+    
+    # Parse the raw bytes directly; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    try:
+        return loads(body)
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON parsing error: {e}")
+        logger.error(f"Response content: {body[:200].decode('utf-8', 'replace')}...")
+        return None
+
+def _collect_papers(collection, papers, max_papers, pattern=None, seen=None, current=None):
+    """Append formatted papers from one API page, returning True once max_papers is reached.
+    
+    Papers found in `seen` (keyed by DOI and version) are reused instead of being
+    formatted again; every collected paper is recorded in `current`.
+    """
+    logger.info(f"Found {len(collection)} papers in this batch")
+    
+    for paper in collection:
+        # Filter on the raw strings before building any per-paper dicts
+        raw_title = paper.get('title', '')
+        raw_abstract = paper.get('abstract', '')
+        if pattern is not None and not pattern.search(raw_title) and not pattern.search(raw_abstract):
+            continue
+        
+        # Print first paper details for debugging
+        if len(papers) == 0:
+            logger.info(f"Example paper: {json.dumps(paper, indent=2)[:200]}...")
+        
+        key = f"{paper.get('doi', '')}v{paper.get('version', '1')}"
+        formatted = seen.get(key) if seen else None
+        if formatted is None:
+            paper_data = {
+                'title': raw_title,
+                'authors': paper.get('authors', ''),
+                'abstract': raw_abstract,
+                'url': f"https://www.biorxiv.org/content/{key}",
+                'pdf_url': f"https://www.biorxiv.org/content/{key}.full.pdf",
+                'published': paper.get('date', ''),
+                'doi': paper.get('doi', ''),
+                'source': 'biorxiv'
+            }
+            formatted = format_paper(paper_data)
+        
+        papers.append(formatted)
+        if current is not None:
+            current[key] = formatted
+        
+        if len(papers) >= max_papers:
+            return True
+    
+    return False
+
+async def _afetch(api_url, start_str, end_str, max_papers=50, pattern=None, seen=None, current=None):
+    """Fetch papers from the bioRxiv API, requesting cursor pages concurrently."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    timeout = aiohttp.ClientTimeout(total=60)
     papers = []
-    cursor = 0
     
-    while len(papers) < max_papers:
-        # The correct endpoint for bioRxiv API - using details with direct JSON output
-        full_url = f"{api_url}/{start_str}/{end_str}/{cursor}"
-        logger.info(f"Requesting: {full_url}")
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        # The first page tells us how many papers the date range holds
+        data = await _afetch_page(session, semaphore, f"{api_url}/{start_str}/{end_str}/0")
+        if data is None:
+            return papers
         
+        # Debug response structure
+        logger.info(f"Response keys: {list(data.keys())}")
+        
+        # Check messages from API
+        messages = data.get('messages', [])
+        if messages:
+            logger.info(f"API message: {messages}")
+        
+        collection = data.get('collection', [])
         try:
-            response = requests.get(full_url)
-            response.raise_for_status()  # Raise exception on 4xx/5xx responses
-            
-            data = response.json()
-            
-            # Debug response structure
-            if cursor == 0:
-                logger.info(f"Response keys: {list(data.keys())}")
-                
-            # Check messages from API
-            if 'messages' in data:
-                logger.info(f"API message: {data['messages']}")
-                
-            collection = data.get('collection', [])
-            logger.info(f"Found {len(collection)} papers in this batch")
-            
-            if not collection:
-                logger.info("No more papers available")
-                break
-                
-            for paper in collection:
-                # Print first paper details for debugging
-                if len(papers) == 0 and cursor == 0:
-                    logger.info(f"Example paper: {json.dumps(paper, indent=2)[:200]}...")
-                
-                paper_data = {
-                    'title': paper.get('title', ''),
-                    'authors': paper.get('authors', ''),
-                    'abstract': paper.get('abstract', ''),
-                    'url': f"https://www.biorxiv.org/content/{paper.get('doi', '')}v{paper.get('version', '1')}",
-                    'pdf_url': f"https://www.biorxiv.org/content/{paper.get('doi', '')}v{paper.get('version', '1')}.full.pdf",
-                    'published': paper.get('date', ''),
-                    'doi': paper.get('doi', ''),
-                    'source': 'biorxiv'
-                }
-                papers.append(format_paper(paper_data))
-                
-                if len(papers) >= max_papers:
-                    break
-                    
-            cursor += len(collection)
-            time.sleep(1)  # Respect rate limits
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            break
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {e}")
-            logger.error(f"Response content: {response.text[:200]}...")
-            break
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            break
+            total = int(messages[0].get('total', len(collection)))
+        except (IndexError, TypeError, ValueError):
+            total = len(collection)
+        
+        if _collect_papers(collection, papers, max_papers, pattern, seen, current):
+            return papers
+        
+        # Without a keyword filter every paper counts, so only the first max_papers are needed;
+        # with one, keep paging until enough papers match, the date range is exhausted or
+        # MAX_PAGES pages have been read
+        last_cursor = total if pattern is not None else min(total, max_papers)
+        last_cursor = min(last_cursor, MAX_PAGES * BIORXIV_PAGE_SIZE)
+        cursors = list(range(BIORXIV_PAGE_SIZE, last_cursor, BIORXIV_PAGE_SIZE))
+        
+        # The cursor endpoint is stable, so pages are requested in concurrent batches
+        for i in range(0, len(cursors), MAX_CONCURRENT_REQUESTS):
+            if i:
+                await asyncio.sleep(BATCH_INTERVAL)
+            pages = await asyncio.gather(*(
+                _afetch_page(session, semaphore, f"{api_url}/{start_str}/{end_str}/{cursor}")
+                for cursor in cursors[i:i + MAX_CONCURRENT_REQUESTS]
+            ))
+            for page in pages:
+                if page is not None and _collect_papers(page.get('collection', []), papers, max_papers, pattern, seen, current):
+                    return papers
     
+    if not papers:
+        logger.info("No more papers available")
     return papers
 
+def fetch_biorxiv_papers(api_url, start_str, end_str, max_papers=50, pattern=None, seen=None, current=None):
+    """Helper function to fetch papers from bioRxiv API.
+    
+    If a compiled keyword `pattern` is given, papers whose title and abstract
+    do not match are skipped before they are formatted. `seen` and `current`
+    are the previous and current run's formatted papers keyed by DOI and version.
+    """
+    try:
+        return asyncio.run(_afetch(api_url, start_str, end_str, max_papers, pattern, seen, current))
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        return []
+
 def scrape_biorxiv(start_date, end_date, max_papers=50):
     """Scrape bioRxiv for papers published between start_date and end_date."""
     try:
-        # Define base_dir here explicitly
-        base_dir = Path(__file__).resolve().parents[2]
+        base_dir = _BASE_DIR
         
         # Use wider date range for testing - bioRxiv may not have many recent papers
         # that match machine learning terms
@@ -121,32 +233,24 @@ def scrape_biorxiv(start_date, end_date, max_papers=50):
         
         logger.info(f"Using date range for bioRxiv: {start_str} to {end_str}")
         
-        # Load keywords for filtering
-        keywords_path = base_dir / "config" / "keywords.json"
-        keywords = load_config(keywords_path)
-        
-        # Fetch papers from the API
+        # Fetch papers from the API, keeping only those that match the keywords
         api_url = "https://api.biorxiv.org/details/biorxiv"
-        papers = fetch_biorxiv_papers(api_url, start_str, end_str, max_papers)
-        
-        # Filter papers by keywords if needed
-        if keywords and len(papers) > max_papers:
-            filtered_papers = []
-            for paper in papers:
-                combined_text = f"{paper['title']} {paper['abstract']}"
-                if keyword_matches(combined_text, keywords):
-                    filtered_papers.append(paper)
-            
-            logger.info(f"Filtered from {len(papers)} to {len(filtered_papers)} papers based on keywords")
-            papers = filtered_papers[:max_papers]
+        pattern = _KEYWORD_PATTERN
+        
+        # Reuse papers formatted by the previous run; keep only this run's papers
+        seen_path = base_dir / "data" / "cache" / "seen_biorxiv.json"
+        seen = load_seen(seen_path)
+        current = {}
+        papers = fetch_biorxiv_papers(api_url, start_str, end_str, max_papers, pattern, seen, current)
+        save_seen(seen_path, current)
         
         # Save raw data
         raw_data_dir = base_dir / "data" / "raw"
         os.makedirs(raw_data_dir, exist_ok=True)
         output_file = raw_data_dir / f"biorxiv_{start_date.strftime('%Y%m%d')}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(papers, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(dumps(papers))
             
         logger.info(f"Saved {len(papers)} papers to {output_file}")
         return papers
@@ -1,16 +1,243 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 import logging
 import json
 import os
 import datetime
-import time
 from pathlib import Path
 import re
-from urllib.parse import urljoin
+import sys
+import threading
+import time
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from functools import lru_cache, partial
+
+if __name__ == "__main__":
+    # Run as a script: add the src directory to the Python path, as main.py does
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from filtering.keyword_filter import compile_keyword_pattern
+from utils.fastjson import dumps_line
+from scrapers._seen import load_seen, save_seen
+
+try:
+    import ciso8601
+except ImportError:  # ciso8601 is optional; ISO dates then go through strptime
+    ciso8601 = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; keyword matching then falls back to compiled regex alternations
+    ahocorasick = None
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional; pages are then always downloaded in full
+    requests_cache = None
 
 logger = logging.getLogger(__name__)
 
+# Overall deadline in seconds for scraping all blogs; one stuck site must not hold up the digest
+SCRAPE_TIMEOUT = 300
+
+# HTTP responses are cached on disk between runs
+_HTTP_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "cache" / "blog_http_cache.sqlite"
+
+# Last-Modified header and entries of each blog page, to skip pages that have not changed
+_PAGE_CACHE_PATH = _HTTP_CACHE_PATH.parent / "blog_pages.json"
+
+# One keep-alive session shared by all blog scrapers, created on first use so importing
+# the module doesn't create the on-disk HTTP cache
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session():
+    """Return the shared blog session, creating it on the first call."""
+    global _SESSION
+    # Scraper threads may ask for the session at the same time; only one may build it
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            if requests_cache is not None:
+                # Expired pages are revalidated with ETag / Last-Modified, so unchanged ones come back as a bodiless 304
+                session = requests_cache.CachedSession(
+                    str(_HTTP_CACHE_PATH),
+                    backend='sqlite',
+                    expire_after=3600,
+                    cache_control=True,
+                    allowable_methods=('GET',)
+                )
+            else:
+                session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml',
+                'Accept-Language': 'en-US,en;q=0.9',
+            })
+            # One pool per blog host, each large enough for every thread that might hit it
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            ))
+            _SESSION = session
+        return _SESSION
+
+# Date patterns used when parsing publication dates
+_RE_MONTH_NAME_YEAR = re.compile(r'([A-Za-z]+)\s+(\d{4})$')     # March 2025
+_RE_YEAR_MONTH = re.compile(r'(\d{4})-(\d{1,2})$')               # 2025-03
+_RE_LOOSE_YMD = re.compile(r'(\d{4})[-/]?(\d{1,2})[-/]?(\d{1,2})')  # 20250301, 2025/3/1, ...
+_RE_MONTH_YEAR_SPACE = re.compile(r'[A-Za-z]+ \d{4}$')            # March 2025 (Transformer Circuits)
+_RE_ISO_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')               # 2025-03-01, used with fullmatch
+
+# Byte-level pre-screen for the Transformer Circuits "paper" class (matched case-insensitively)
+_RE_PAPER_BYTES = re.compile(rb'paper', re.IGNORECASE)
+
+# Only build trees for the elements each scraper selects (matches keep their whole subtree)
+_ANTHROPIC_STRAINER = SoupStrainer(class_=re.compile(r'post|card'))
+_OPENAI_STRAINER = SoupStrainer('div', class_=re.compile(r'border-primary-4|py-md|border-b'))
+_DEEPMIND_STRAINER = SoupStrainer('li', class_=re.compile(r'publication|item'))
+_DEEPMIND_FALLBACK_STRAINER = SoupStrainer('div', class_=re.compile(r'card|publication'))
+_RE_ARTICLE_BYTES = re.compile(rb'<article', re.IGNORECASE)
+
+# Selectors run on every Anthropic post card, compiled once; kept separate where the original
+# `a or b` lookups prefer one match over another regardless of document order
+_SEL_POST_HEADING = soupsieve.compile('[class*="post-heading"]')
+_SEL_HEADING = soupsieve.compile('h2, h3, h4, h5')
+_SEL_POST_DATE = soupsieve.compile('[class*="post-date"]')
+_SEL_TIMESTAMP = soupsieve.compile('[class*="timestamp"]')
+_SEL_POST_CATEGORY = soupsieve.compile('[class*="post-category"]')
+
+@lru_cache(maxsize=4096)
+def _strptime_or_none(date_string, fmt):
+    """Parse date_string with fmt, returning None instead of raising so failures are cached too."""
+    try:
+        return datetime.datetime.strptime(date_string, fmt)
+    except ValueError:
+        return None
+
+def _strptime_cached(date_string, fmt):
+    """Memoized drop-in for datetime.datetime.strptime; dates repeat heavily across entries."""
+    parsed = _strptime_or_none(date_string, fmt)
+    if parsed is None:
+        raise ValueError(f"time data {date_string!r} does not match format {fmt!r}")
+    return parsed
+
+def _parse_iso_date(date_string):
+    """Parse an ISO-8601 date or datetime with ciso8601, returning the naive date at midnight or None."""
+    if ciso8601 is None:
+        return None
+    try:
+        parsed = ciso8601.parse_datetime(date_string)
+    except ValueError:
+        return None
+    # Only the day matters here, which is also what the strptime formats below yield
+    return parsed.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+
+# Time of the latest page fetch from each host, for spacing out page requests to the same site
+_HOST_LAST_REQUEST = {}
+_HOST_LAST_REQUEST_LOCK = threading.Lock()
+
+def _throttle(host, min_interval=2.0):
+    """Sleep until at least min_interval seconds have passed since the previous page fetch from host."""
+    with _HOST_LAST_REQUEST_LOCK:
+        now = time.monotonic()
+        last = _HOST_LAST_REQUEST.get(host)
+        # Reserve the slot under the lock so concurrent callers queue up behind each other
+        start = now if last is None else max(now, last + min_interval)
+        _HOST_LAST_REQUEST[host] = start
+    if start > now:
+        time.sleep(start - now)
+
+def _fetch_page(url, site_name):
+    """GET a blog page with the shared session, returning its content or None if the request was not successful."""
+    _throttle(urlparse(url).netloc)
+    response = _get_session().get(url, timeout=60)
+    if response.status_code != 200:
+        logger.error(f"Failed to access {site_name}: {response.status_code}")
+        return None
+    return response.content
+
+# Last date format that worked for each source; a site formats all its dates the same way
+_FMT_CACHE = {}
+
+# Possible lengths of the text matched by each strptime directive used here (None = unbounded)
+_DIRECTIVE_LENGTHS = {'Y': (4, 4), 'y': (2, 2), 'm': (1, 2), 'd': (1, 2), 'b': (3, 3), 'B': (3, 9)}
+
+@lru_cache(maxsize=None)
+def _format_length_bounds(fmt):
+    """Return the (min, max) length of strings fmt can parse; max is None if unbounded."""
+    min_len, max_len = 0, 0
+    chars = iter(fmt)
+    for char in chars:
+        if char == '%':
+            low, high = _DIRECTIVE_LENGTHS.get(next(chars, ''), (0, None))
+        elif char.isspace():
+            low, high = 1, None  # strptime lets a space in the format match any run of whitespace
+        else:
+            low, high = 1, 1
+        min_len += low
+        max_len = None if max_len is None or high is None else max_len + high
+    return min_len, max_len
+
+def _fits_format_length(date_text, fmt):
+    """Cheap check that date_text has a length fmt could possibly parse."""
+    min_len, max_len = _format_length_bounds(fmt)
+    return min_len <= len(date_text) and (max_len is None or len(date_text) <= max_len)
+
+def _format_date(date_text, date_formats, source=None):
+    """Return date_text as YYYY-MM-DD using the first format that parses it, or None.
+    
+    The format that last worked for source is tried first.
+    """
+    # A valid ISO date is already in the output format, so it needs no strptime at all
+    if '%Y-%m-%d' in date_formats:
+        iso_match = _RE_ISO_DATE.fullmatch(date_text)
+        if iso_match:
+            try:
+                datetime.date(*map(int, iso_match.groups()))
+                return date_text
+            except ValueError:
+                pass
+    cached_fmt = _FMT_CACHE.get(source)
+    if cached_fmt in date_formats:
+        parsed_date = _strptime_or_none(date_text, cached_fmt)
+        if parsed_date is not None:
+            return parsed_date.strftime('%Y-%m-%d')
+    for fmt in date_formats:
+        if fmt == cached_fmt or not _fits_format_length(date_text, fmt):
+            continue
+        parsed_date = _strptime_or_none(date_text, fmt)
+        if parsed_date is not None:
+            if source is not None:
+                _FMT_CACHE[source] = fmt
+            return parsed_date.strftime('%Y-%m-%d')
+    return None
+
+def _make_entry(title, url, published, abstract, authors, source):
+    """Build a blog entry dict in the format shared by all scrapers."""
+    return {
+        'title': title,
+        'url': url,
+        'published': published,
+        'abstract': abstract,
+        'authors': authors,
+        'source': source
+    }
+
+def _dedup_append(entries, seen_urls, entry):
+    """Append entry unless an entry with the same URL was already added; returns whether it was appended."""
+    url = entry['url']
+    if url:  # Entries without a URL can't be told apart this way
+        if url in seen_urls:
+            return False
+        seen_urls.add(url)
+    entries.append(entry)
+    return True
+
 def load_config(config_path):
     """Load configuration from a JSON file."""
     try:
@@ -20,28 +247,141 @@ def load_config(config_path):
         logger.error(f"Error loading config from {config_path}: {e}")
         return {}
 
+# Config is read once per process; scheduled jobs may call scrape_blogs repeatedly
+@lru_cache(maxsize=1)
+def _base_dir():
+    """Return the repository root."""
+    return Path(__file__).resolve().parents[2]
+
+@lru_cache(maxsize=1)
+def _blog_sources():
+    """Return the blog sources listed in config/sources.json."""
+    return load_config(_base_dir() / "config" / "sources.json").get('blogs', [])
+
+@lru_cache(maxsize=1)
+def _keywords():
+    """Return the keyword config from config/keywords.json."""
+    return load_config(_base_dir() / "config" / "keywords.json")
+
+# Keyword matchers per keywords dict, keyed by id() with the dict kept alive alongside
+_KEYWORD_MATCHERS = {}
+
+def _build_automaton(terms):
+    """Build an Aho-Corasick automaton over already lowercased terms, or None if there are none."""
+    if not terms:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+def _keyword_matchers(keywords):
+    """Return the (positive, exclude) matchers for a keywords dict.
+
+    These are Aho-Corasick automata when pyahocorasick is installed and compiled regex
+    alternations otherwise; either way they are built once per dict, not per entry.
+    """
+    cached = _KEYWORD_MATCHERS.get(id(keywords))
+    if cached is None or cached[0] is not keywords:
+        positive = [term.lower() for term in keywords.get('ml_terms', []) + keywords.get('biology_terms', [])]
+        exclude = [term.lower() for term in keywords.get('exclude_terms', [])]
+        if ahocorasick is not None:
+            matchers = (_build_automaton(positive), _build_automaton(exclude))
+        else:
+            matchers = (compile_keyword_pattern(positive), compile_keyword_pattern(exclude))
+        cached = _KEYWORD_MATCHERS[id(keywords)] = (keywords, matchers)
+    return cached[1]
+
 def keyword_matches(entry, keywords):
     """Check if entry matches any keywords."""
     if not keywords:
         return True
-        
-    ml_terms = keywords.get('ml_terms', [])
-    biology_terms = keywords.get('biology_terms', [])
-    exclude_terms = keywords.get('exclude_terms', [])
     
-    all_terms = ml_terms + biology_terms
+    positive, exclude = _keyword_matchers(keywords)
     
     # Combine all text fields
     text = f"{entry['title']} {entry['abstract']} {entry['authors']}"
     text_lower = text.lower()
     
-    # Check if any positive terms match
-    matches_positive = any(term.lower() in text_lower for term in all_terms)
+    # An exclude hit rejects the entry, so there is no point scanning for positives first
+    if ahocorasick is not None:
+        if exclude is not None and next(exclude.iter(text_lower), None) is not None:
+            return False
+        return positive is not None and next(positive.iter(text_lower), None) is not None
+    
+    if exclude.search(text_lower):
+        return False
+    return positive.search(text_lower) is not None
+
+@lru_cache(maxsize=4096)
+def _parse_published(published):
+    """
+    Parse a published date string once; entries and reruns repeat the same strings.
+    
+    Returns:
+        tuple | datetime | None: (year, month) for month-only dates, a datetime for
+        dates with a day, or None if the string can't be parsed
+    """
+    # Check for month-year format patterns first; each regex runs at most once
+    m_name = _RE_MONTH_NAME_YEAR.match(published)
+    m_iso = None if m_name else _RE_YEAR_MONTH.match(published)
+    if m_name or m_iso:
+        # This is a month-year format (e.g., "March 2025" or "2025-03")
+        if m_name:
+            # Convert month name to number
+            month_name, year_str = m_name.groups()
+            try:
+                temp_date = _strptime_cached(f"{month_name} 1, {year_str}", "%B 1, %Y")
+            except ValueError:
+                # Try abbreviated month name
+                try:
+                    temp_date = _strptime_cached(f"{month_name} 1, {year_str}", "%b 1, %Y")
+                except ValueError:
+                    logger.warning(f"Could not parse month name: {month_name}")
+                    return None
+            return (temp_date.year, temp_date.month)
+        # Format is YYYY-MM
+        year_str, month_str = m_iso.groups()
+        month = int(month_str)
+        if not 1 <= month <= 12:
+            logger.warning(f"Invalid month in date: {published}")
+            return None
+        return (int(year_str), month)
+        
+    # For specific dates (with day information), use the existing logic
+    date_formats = [
+        '%Y-%m-%d',            # 2025-03-01
+        '%B %d, %Y',           # March 1, 2025
+        '%d %B %Y',            # 1 March 2025
+        '%Y/%m/%d',            # 2025/03/01
+    ]
     
-    # Check if any exclude terms match
-    matches_exclude = any(term.lower() in text_lower for term in exclude_terms)
+    # Well-formed ISO dates take the C fast path
+    parsed_date = _parse_iso_date(published)
+    for fmt in date_formats if parsed_date is None else ():
+        try:
+            parsed_date = _strptime_cached(published, fmt)
+            break
+        except ValueError:
+            continue
+            
+    if not parsed_date:
+        # Try to extract year, month, day from any format
+        date_match = _RE_LOOSE_YMD.search(published)
+        if date_match:
+            year, month, day = date_match.groups()
+            try:
+                parsed_date = datetime.datetime(int(year), int(month), int(day))
+            except ValueError:
+                # Handle invalid dates
+                logger.warning(f"Invalid date components: {year}-{month}-{day}")
+                return None
     
-    return matches_positive and not matches_exclude
+    if not parsed_date:
+        logger.warning(f"Could not parse date: {published}")
+        return None
+    return parsed_date
 
 def is_recent_publication(entry, start_date, end_date):
     """Check if an entry was published within the given date range."""
@@ -50,91 +390,31 @@ def is_recent_publication(entry, start_date, end_date):
         published = entry.get('published', '')
         if not published:
             return False  # No date, can't determine if recent
+        
+        # Every accepted format spells out a 4-digit year, so reject dates without a nearby one cheaply
+        if not any(str(year) in published for year in range(start_date.year - 1, end_date.year + 2)):
+            return False
+        
+        parsed = _parse_published(published)
+        if parsed is None:
+            return False  # Include by default if date can't be parsed
+        
+        if isinstance(parsed, tuple):
+            entry_year, entry_month = parsed
             
-        # Check for month-year format patterns first
-        month_year_match = re.match(r'([A-Za-z]+)\s+(\d{4})$', published) or re.match(r'(\d{4})-(\d{1,2})$', published)
-        if month_year_match:
-            # This is a month-year format (e.g., "March 2025" or "2025-03")
-            if re.match(r'([A-Za-z]+)\s+(\d{4})$', published):
-                # Convert month name to number
-                month_name, year_str = month_year_match.groups()
-                try:
-                    temp_date = datetime.datetime.strptime(f"{month_name} 1, {year_str}", "%B 1, %Y")
-                    entry_month = temp_date.month
-                    entry_year = temp_date.year
-                except ValueError:
-                    # Try abbreviated month name
-                    try:
-                        temp_date = datetime.datetime.strptime(f"{month_name} 1, {year_str}", "%b 1, %Y")
-                        entry_month = temp_date.month
-                        entry_year = temp_date.year
-                    except ValueError:
-                        logger.warning(f"Could not parse month name: {month_name}")
-                        return False
-            else:
-                # Format is YYYY-MM
-                year_str, month_str = month_year_match.groups()
-                entry_year = int(year_str)
-                entry_month = int(month_str)
-            
-            # Check if this month-year is the current month or previous month relative to end_date
-            end_year = end_date.year
-            end_month = end_date.month
-            
-            # Create a range of acceptable months (previous, current, next)
-            if end_month == 1:
-                acceptable_months = [(end_year-1, 12), (end_year, 1), (end_year, 2)]
-            elif end_month == 12:
-                acceptable_months = [(end_year, 11), (end_year, 12), (end_year+1, 1)]
-            else:
-                acceptable_months = [(end_year, end_month-1), (end_year, end_month), (end_year, end_month+1)]
-            
-            # Include if it's within the acceptable range
-            if (entry_year, entry_month) in acceptable_months:
+            # Include the month of end_date and the months either side of it; counting months
+            # since year 0 handles the December/January wrap-around without building a list
+            if abs((entry_year * 12 + entry_month) - (end_date.year * 12 + end_date.month)) <= 1:
                 return True
             
             # Also check against start_date (for older papers)
             start_year_month = (start_date.year, start_date.month)
             end_year_month = (end_date.year, end_date.month)
-            entry_year_month = (entry_year, entry_month)
 
-            return start_year_month <= entry_year_month <= end_year_month
-            
-        # For specific dates (with day information), use the existing logic
-        date_formats = [
-            '%Y-%m-%d',            # 2025-03-01
-            '%B %d, %Y',           # March 1, 2025
-            '%d %B %Y',            # 1 March 2025
-            '%Y/%m/%d',            # 2025/03/01
-        ]
-        
-        parsed_date = None
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.datetime.strptime(published, fmt)
-                break
-            except ValueError:
-                continue
-                
-        if not parsed_date:
-            # Try to extract year, month, day from any format
-            date_match = re.search(r'(\d{4})[-/]?(\d{1,2})[-/]?(\d{1,2})', published)
-            if date_match:
-                year, month, day = date_match.groups()
-                try:
-                    parsed_date = datetime.datetime(int(year), int(month), int(day))
-                except ValueError:
-                    # Handle invalid dates
-                    logger.warning(f"Invalid date components: {year}-{month}-{day}")
-                    return False
+            return start_year_month <= parsed <= end_year_month
         
         # If we have a specific date, do the direct comparison
-        if parsed_date:
-            return start_date <= parsed_date <= end_date
-            
-        # If we couldn't parse the date in any way
-        logger.warning(f"Could not parse date: {published}")
-        return False  # Include by default if date can't be parsed
+        return start_date <= parsed <= end_date
         
     except Exception as e:
         logger.error(f"Error checking publication date: {e}")
@@ -143,25 +423,23 @@ def is_recent_publication(entry, start_date, end_date):
 def scrape_anthropic_research(url):
     """Scrape Anthropic news page for recent announcements and updates."""
     entries = []
+    seen_urls = set()  # Entry URLs already added, to skip the same post listed twice
+    today_str = datetime.datetime.now().strftime('%Y-%m-%d')
     try:
         logger.info(f"Scraping Anthropic news: {url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=60)
-        if response.status_code != 200:
-            logger.error(f"Failed to access Anthropic news: {response.status_code}")
+        content = _fetch_page(url, "Anthropic news")
+        if content is None:
             return entries
             
         # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml', parse_only=_ANTHROPIC_STRAINER)
         
         # Specifically target PostCard elements based on the provided structure
-        post_cards = soup.select('a[class*="PostCard_post-card"]') or soup.select('a[class*="post-card"]')
+        # Only run the selectors if the raw page mentions post-card at all
+        post_cards = []
+        if b'post-card' in content:
+            post_cards = soup.select('a[class*="PostCard_post-card"]') or soup.select('a[class*="post-card"]')
         
         logger.info(f"Found {len(post_cards)} post cards on Anthropic news page")
         
@@ -173,7 +451,7 @@ def scrape_anthropic_research(url):
             news_url = urljoin("https://www.anthropic.com", url_path) if url_path else ""
             
             # Find title in the heading element
-            title_elem = card.select_one('[class*="post-heading"]') or card.find(['h2', 'h3', 'h4', 'h5'])
+            title_elem = _SEL_POST_HEADING.select_one(card) or _SEL_HEADING.select_one(card)
             if not title_elem:
                 continue
                 
@@ -186,40 +464,24 @@ def scrape_anthropic_research(url):
             seen_titles.add(title)
             
             # Find date in the timestamp element
-            date = datetime.datetime.now().strftime('%Y-%m-%d')  # Default to today
-            date_elem = card.select_one('[class*="post-date"]') or card.select_one('[class*="timestamp"]')
+            date = today_str  # Default to today
+            date_elem = _SEL_POST_DATE.select_one(card) or _SEL_TIMESTAMP.select_one(card)
             
             if date_elem:
                 date_text = date_elem.text.strip()
                 if date_text:
                     # Try to parse the date - common format is "Mar 27, 2025"
-                    try:
-                        date_formats = ['%b %d, %Y', '%B %d, %Y', '%Y-%m-%d', '%m/%d/%Y']
-                        for fmt in date_formats:
-                            try:
-                                parsed_date = datetime.datetime.strptime(date_text, fmt)
-                                date = parsed_date.strftime('%Y-%m-%d')
-                                break
-                            except ValueError:
-                                continue
-                    except Exception as e:
-                        logger.warning(f"Could not parse date '{date_text}': {e}")
+                    date = _format_date(date_text, ['%b %d, %Y', '%B %d, %Y', '%Y-%m-%d', '%m/%d/%Y'], 'anthropic_news') or date
             
             # Find category tags if available
             category = ""
-            category_elem = card.select_one('[class*="post-category"]')
+            category_elem = _SEL_POST_CATEGORY.select_one(card)
             if category_elem:
                 category = category_elem.text.strip()
             
             # Add the entry
-            entries.append({
-                'title': title,
-                'url': news_url,
-                'published': date,
-                'abstract': category,  # Use category as abstract if no other content is available
-                'authors': "Anthropic",
-                'source': 'anthropic_news'
-            })
+            # Use category as abstract if no other content is available
+            _dedup_append(entries, seen_urls, _make_entry(title, news_url, date, category, "Anthropic", 'anthropic_news'))
             #logger.info(f"Found Anthropic news: {title}")
         
         # If the specific approach didn't find any entries, fall back to the general approach
@@ -254,44 +516,38 @@ def scrape_anthropic_research(url):
                         news_url = urljoin("https://www.anthropic.com", url_path) if url_path else ""
                 
                 # Add the entry
-                entries.append({
-                    'title': title,
-                    'url': news_url,
-                    'published': datetime.datetime.now().strftime('%Y-%m-%d'),
-                    'abstract': "",
-                    'authors': "Anthropic",
-                    'source': 'anthropic_news'
-                })
+                _dedup_append(entries, seen_urls, _make_entry(title, news_url, today_str, "", "Anthropic", 'anthropic_news'))
                 #logger.info(f"Found Anthropic news (fallback): {title}")
         
         logger.info(f"Total Anthropic news items found: {len(entries)}")
         return entries
         
     except Exception as e:
-        logger.error(f"Error scraping Anthropic news: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error scraping Anthropic news: {e}")
         return entries
 
 def scrape_circuits_research(url):
     """Scrape Anthropic's Transformer Circuits research blog with specific structure."""
     entries = []
+    seen_urls = set()  # Entry URLs already added, to skip the same post listed twice
+    now = datetime.datetime.now()
+    today_str = now.strftime('%Y-%m-%d')
     seen_titles = set()  # Track seen titles to avoid duplicates
     
     try:
         logger.info(f"Scraping Transformer Circuits: {url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
+        content = _fetch_page(url, "Transformer Circuits")
+        if content is None:
+            return entries
         
-        response = requests.get(url, headers=headers, timeout=60)
-        if response.status_code != 200:
-            logger.error(f"Failed to access Transformer Circuits: {response.status_code}")
+        # Without "paper" anywhere in the page no class can contain it, so skip building the tree
+        if not _RE_PAPER_BYTES.search(content):
+            logger.info("Found 0 paper elements with 'paper' in class name")
             return entries
             
         # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml')
         
         # Specifically look for elements containing "paper" in their class
         paper_elements = []
@@ -337,29 +593,29 @@ def scrape_circuits_research(url):
                 date = date_elem.text.strip()
             else:
                 # Default to current date
-                date = datetime.datetime.now().strftime('%Y-%m-%d')
+                date = today_str
             
             # Parse the date which might be in month/year format
             # If it's a simple "Month Year" format, convert it
             try:
                 # Check if the date is in "Month Year" format like "March 2023"
-                if re.match(r'[A-Za-z]+ \d{4}$', date):
+                if _RE_MONTH_YEAR_SPACE.match(date):
                     # Convert to YYYY-MM-DD format with the last day of the month (but not further in the future than now)
-                    parsed_date = datetime.datetime.strptime(date, '%B %Y')
+                    parsed_date = _strptime_cached(date, '%B %Y')
                     date = parsed_date.strftime('%Y-%m-%d')
                     # make sure it is the last day of the month
                     last_day = (parsed_date + datetime.timedelta(days=31)).replace(day=1) - datetime.timedelta(days=1)
                     date = last_day.strftime('%Y-%m-%d')
                     # check if the date is in the future
-                    if parsed_date > datetime.datetime.now():
-                        date = datetime.datetime.now().strftime('%Y-%m-%d')
+                    if parsed_date > now:
+                        date = today_str
             except:
                 # Keep original if parsing fails
                 pass
 
             # check if date is in the future
-            if date and (datetime.datetime.strptime(date, '%Y-%m-%d') > datetime.datetime.now()):
-                date = datetime.datetime.now().strftime('%Y-%m-%d')
+            if date and (_strptime_cached(date, '%Y-%m-%d') > now):
+                date = today_str
             
             # Extract URL - IMPROVED URL EXTRACTION FOR TRANSFORMER CIRCUITS
             url_path = ""
@@ -390,15 +646,8 @@ def scrape_circuits_research(url):
                 abstract = abstract_elem.text.strip()
             
             # Add the entry
-            entries.append({
-                'title': title,
-                'url': full_url,
-                'published': date,
-                'abstract': abstract,
-                'authors': "Anthropic Transformer Circuits Team",
-                'source': 'transformer_circuits'
-            })
-            logger.info(f"Found Transformer Circuits paper: {title} ({date}) - {full_url}")
+            _dedup_append(entries, seen_urls, _make_entry(title, full_url, date, abstract, "Anthropic Transformer Circuits Team", 'transformer_circuits'))
+            logger.debug("Found Transformer Circuits paper: %s (%s) - %s", title, date, full_url)
         
         logger.info(f"Total Transformer Circuits entries found: {len(entries)}")
         return entries
@@ -410,22 +659,17 @@ def scrape_circuits_research(url):
 def scrape_openai_research(url):
     """Scrape OpenAI publications page with specific structure."""
     entries = []
+    seen_urls = set()  # Entry URLs already added, to skip the same post listed twice
+    today_str = datetime.datetime.now().strftime('%Y-%m-%d')
     try:
         logger.info(f"Scraping OpenAI publications: {url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=60)
-        if response.status_code != 200:
-            logger.error(f"Failed to access OpenAI publications: {response.status_code}")
+        content = _fetch_page(url, "OpenAI publications")
+        if content is None:
             return entries
         
         # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml', parse_only=_OPENAI_STRAINER)
         
         # Find publication divs with the specific structure from the example
         publication_items = soup.select('div.py-md.border-primary-4') or soup.select('div[class*="border-primary-4"]')
@@ -469,37 +713,30 @@ def scrape_openai_research(url):
             full_url = urljoin("https://openai.com", url_path) if url_path else ""
             
             # Extract date from the time element
-            date = datetime.datetime.now().strftime('%Y-%m-%d')  # Default to today
+            date = today_str  # Default to today
             time_elem = item.find('time')
             if time_elem:
                 # First try datetime attribute
                 if 'datetime' in time_elem.attrs:
                     date_text = time_elem['datetime']
-                    # Handle ISO format with time (e.g., 2025-03-25T11:00)
-                    if 'T' in date_text:
-                        date_text = date_text.split('T')[0]
-                    try:
-                        parsed_date = datetime.datetime.strptime(date_text, '%Y-%m-%d')
+                    parsed_date = _parse_iso_date(date_text)
+                    if parsed_date is None:
+                        # Handle ISO format with time (e.g., 2025-03-25T11:00)
+                        if 'T' in date_text:
+                            date_text = date_text.split('T')[0]
+                        try:
+                            parsed_date = _strptime_cached(date_text, '%Y-%m-%d')
+                        except ValueError:
+                            # Use the visible text as fallback
+                            date_text = time_elem.text.strip()
+                    if parsed_date is not None:
                         date = parsed_date.strftime('%Y-%m-%d')
-                    except ValueError:
-                        # Use the visible text as fallback
-                        date_text = time_elem.text.strip()
                 else:
                     date_text = time_elem.text.strip()
                 
                 # Try to parse visible date text if needed
-                if date == datetime.datetime.now().strftime('%Y-%m-%d') and date_text:
-                    try:
-                        date_formats = ['%b %d, %Y', '%B %d, %Y', '%Y-%m-%d']
-                        for fmt in date_formats:
-                            try:
-                                parsed_date = datetime.datetime.strptime(date_text, fmt)
-                                date = parsed_date.strftime('%Y-%m-%d')
-                                break
-                            except ValueError:
-                                continue
-                    except Exception as e:
-                        logger.warning(f"Could not parse date '{date_text}': {e}")
+                if date == today_str and date_text:
+                    date = _format_date(date_text, ['%b %d, %Y', '%B %d, %Y', '%Y-%m-%d'], 'openai_publications') or date
             
             # Extract abstract - look for paragraph with specific class
             abstract = ""
@@ -512,47 +749,149 @@ def scrape_openai_research(url):
                 abstract = abstract_elem.text.strip()
             
             # Add entry
-            entries.append({
-                'title': title,
-                'url': full_url,
-                'published': date,
-                'abstract': abstract,
-                'authors': "OpenAI",
-                'source': 'openai_publications'
-            })
-            logger.info(f"Found OpenAI publication: {title}")
+            _dedup_append(entries, seen_urls, _make_entry(title, full_url, date, abstract, "OpenAI", 'openai_publications'))
+            logger.debug("Found OpenAI publication: %s", title)
         
         logger.info(f"Total OpenAI publications found: {len(entries)}")
         return entries
         
     except Exception as e:
-        logger.error(f"Error scraping OpenAI publications: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error scraping OpenAI publications: {e}")
         return entries
 
+def _deepmind_primary(items, entries, seen_titles, seen_urls, now, today_str):
+    """Add entries for the publication list items of the DeepMind page."""
+    for item in items:
+        # Extract title from the specific link element
+        title_link = item.select_one('a.list-compact__link, a[class*="link--publication"]')
+        if not title_link:
+            continue
+            
+        # Get the inner span if present, otherwise use the link text directly
+        title_span = title_link.select_one('.list-compact__inner')
+        title = title_span.text.strip() if title_span else title_link.text.strip()
+        
+        # Skip duplicates or very short titles
+        if title in seen_titles or len(title) < 15:
+            continue
+            
+        seen_titles.add(title)
+        
+        # Extract URL from the publication link
+        url_path = title_link.get('href', '')
+        full_url = urljoin("https://deepmind.google", url_path) if url_path else ""
+        
+        # Extract date from the time element
+        date = today_str  # Default to today
+        time_elem = item.find('time')
+        if time_elem:
+            # First try datetime attribute
+            if 'datetime' in time_elem.attrs:
+                date_text = time_elem['datetime']
+                parsed_date = _parse_iso_date(date_text)
+                if parsed_date is None:
+                    try:
+                        parsed_date = _strptime_cached(date_text, '%Y-%m-%d')
+                    except ValueError:
+                        # Use the visible text as fallback
+                        date_text = time_elem.text.strip()
+                if parsed_date is not None:
+                    date = parsed_date.strftime('%Y-%m-%d')
+            else:
+                # Get the long date format if available
+                date_span = time_elem.select_one('.list-compact__date--long')
+                if date_span:
+                    date_text = date_span.text.strip()
+                else:
+                    date_text = time_elem.text.strip()
+                
+                # Try to parse the date text
+                date = _format_date(date_text, ['%d %B %Y', '%B %d, %Y', '%d %b %y'], 'deepmind_research') or date
+        
+        # check if date is in the future
+        if date and (_strptime_cached(date, '%Y-%m-%d') > now):
+            date = today_str
+        
+        # Extract authors - they are in the first .glue-caption element after the title
+        authors = "DeepMind"
+        dd_elements = item.find_all('dd', class_='glue-caption')
+        if dd_elements and len(dd_elements) > 0:
+            authors = dd_elements[0].text.strip()
+        
+        # Extract venue - it would be the second .glue-caption if available
+        venue = ""
+        if dd_elements and len(dd_elements) > 1:
+            venue = dd_elements[1].text.strip()
+        
+        # Combine venue with title for abstract if available
+        abstract = venue if venue else ""
+        
+        # Add entry
+        _dedup_append(entries, seen_urls, _make_entry(title, full_url, date, abstract, authors, 'deepmind_research'))
+        logger.debug("Found DeepMind publication: %s", title)
+
+def _deepmind_fallback(items, entries, seen_titles, seen_urls, today_str):
+    """Add entries for generic article/card items, used when the publication list isn't found."""
+    for item in items:
+        # Extract title
+        title_elem = item.find(['h2', 'h3', 'h4']) or item.select_one('[class*="title"]')
+        if not title_elem:
+            continue
+            
+        title = title_elem.text.strip()
+        
+        # Skip duplicates or very short titles
+        if title in seen_titles or len(title) < 15:
+            continue
+            
+        seen_titles.add(title)
+        
+        # Extract URL
+        url_path = ""
+        link = title_elem.find('a') or item.find('a')
+        if link:
+            url_path = link.get('href', '')
+        full_url = urljoin("https://deepmind.google", url_path) if url_path else ""
+        
+        # Extract date
+        date = today_str  # Default to today
+        date_elem = item.find('time') or item.select_one('[class*="date"]')
+        if date_elem:
+            date_text = date_elem.text.strip()
+            # Try to parse the date
+            date = _format_date(date_text, ['%d %B %Y', '%B %d, %Y', '%Y-%m-%d'], 'deepmind_research') or date
+        
+        # Extract abstract
+        abstract = ""
+        abstract_elem = item.find('p')
+        if abstract_elem is None:
+            abstract_elem = item.select_one('[class*="description"], [class*="excerpt"]')
+        # Identity check; Tag equality would compare the two subtrees recursively
+        if abstract_elem is not None and abstract_elem is not title_elem:
+            abstract = abstract_elem.get_text(" ", strip=True)
+        
+        # Add entry using fallback
+        _dedup_append(entries, seen_urls, _make_entry(title, full_url, date, abstract, "DeepMind", 'deepmind_research'))
+        logger.debug("Found DeepMind publication (fallback): %s", title)
+
 def scrape_deepmind_research(url):
     """Scrape DeepMind publications page."""
     entries = []
+    seen_urls = set()  # Entry URLs already added, to skip the same post listed twice
+    now = datetime.datetime.now()
+    today_str = now.strftime('%Y-%m-%d')
     try:
         logger.info(f"Scraping DeepMind publications: {url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=60)
-        if response.status_code != 200:
-            logger.error(f"Failed to access DeepMind publications: {response.status_code}")
+        content = _fetch_page(url, "DeepMind publications")
+        if content is None:
             return entries
         
         # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml', parse_only=_DEEPMIND_STRAINER)
         
         # Specifically target the list items containing publications based on the provided HTML structure
-        publication_items = soup.select('li.list-compact__item')
+        publication_items = soup.select('li.list-compact__item') if b'list-compact__item' in content else []
         
         if not publication_items:
             # Fallback to more general selectors if the specific class isn't found
@@ -561,161 +900,144 @@ def scrape_deepmind_research(url):
         logger.info(f"Found {len(publication_items)} DeepMind publication items")
         
         seen_titles = set()
-        for item in publication_items:
-            # Extract title from the specific link element
-            title_link = item.select_one('a.list-compact__link, a[class*="link--publication"]')
-            if not title_link:
-                continue
-                
-            # Get the inner span if present, otherwise use the link text directly
-            title_span = title_link.select_one('.list-compact__inner')
-            title = title_span.text.strip() if title_span else title_link.text.strip()
-            
-            # Skip duplicates or very short titles
-            if title in seen_titles or len(title) < 15:
-                continue
-                
-            seen_titles.add(title)
-            
-            # Extract URL from the publication link
-            url_path = title_link.get('href', '')
-            full_url = urljoin("https://deepmind.google", url_path) if url_path else ""
-            
-            # Extract date from the time element
-            date = datetime.datetime.now().strftime('%Y-%m-%d')  # Default to today
-            time_elem = item.find('time')
-            if time_elem:
-                # First try datetime attribute
-                if 'datetime' in time_elem.attrs:
-                    date_text = time_elem['datetime']
-                    try:
-                        parsed_date = datetime.datetime.strptime(date_text, '%Y-%m-%d')
-                        date = parsed_date.strftime('%Y-%m-%d')
-                    except ValueError:
-                        # Use the visible text as fallback
-                        date_text = time_elem.text.strip()
-                else:
-                    # Get the long date format if available
-                    date_span = time_elem.select_one('.list-compact__date--long')
-                    if date_span:
-                        date_text = date_span.text.strip()
-                    else:
-                        date_text = time_elem.text.strip()
-                    
-                    # Try to parse the date text
-                    try:
-                        date_formats = ['%d %B %Y', '%B %d, %Y', '%d %b %y']
-                        for fmt in date_formats:
-                            try:
-                                parsed_date = datetime.datetime.strptime(date_text, fmt)
-                                date = parsed_date.strftime('%Y-%m-%d')
-                                break
-                            except ValueError:
-                                continue
-                    except Exception as e:
-                        logger.warning(f"Could not parse date '{date_text}': {e}")
-            
-            # check if date is in the future
-            if date and (datetime.datetime.strptime(date, '%Y-%m-%d') > datetime.datetime.now()):
-                date = datetime.datetime.now().strftime('%Y-%m-%d')
-            
-            # Extract authors - they are in the first .glue-caption element after the title
-            authors = "DeepMind"
-            dd_elements = item.find_all('dd', class_='glue-caption')
-            if dd_elements and len(dd_elements) > 0:
-                authors = dd_elements[0].text.strip()
-            
-            # Extract venue - it would be the second .glue-caption if available
-            venue = ""
-            if dd_elements and len(dd_elements) > 1:
-                venue = dd_elements[1].text.strip()
-            
-            # Combine venue with title for abstract if available
-            abstract = venue if venue else ""
-            
-            # Add entry
-            entries.append({
-                'title': title,
-                'url': full_url,
-                'published': date,
-                'abstract': abstract,
-                'authors': authors,
-                'source': 'deepmind_research'
-            })
-            logger.info(f"Found DeepMind publication: {title}")
+        _deepmind_primary(publication_items, entries, seen_titles, seen_urls, now, today_str)
         
         # If we didn't find any publications with the specific structure, try a more general approach
         if not entries:
             logger.info("No publications found with specific structure, trying fallback method")
             
+            # The strainer only kept list items, so parse the page again for the fallback. A strainer
+            # can't keep bare <article> tags alongside class-filtered divs, so strain only without them
+            if _RE_ARTICLE_BYTES.search(content):
+                soup = BeautifulSoup(content, 'lxml')
+            else:
+                soup = BeautifulSoup(content, 'lxml', parse_only=_DEEPMIND_FALLBACK_STRAINER)
+            
             # Try to find any articles or card elements
             fallback_items = soup.select('article, div[class*="card"], div[class*="publication"]')
             
-            for item in fallback_items:
-                # Extract title
-                title_elem = item.find(['h2', 'h3', 'h4']) or item.select_one('[class*="title"]')
-                if not title_elem:
-                    continue
-                    
-                title = title_elem.text.strip()
-                
-                # Skip duplicates or very short titles
-                if title in seen_titles or len(title) < 15:
-                    continue
-                    
-                seen_titles.add(title)
-                
-                # Extract URL
-                url_path = ""
-                link = title_elem.find('a') or item.find('a')
-                if link:
-                    url_path = link.get('href', '')
-                full_url = urljoin("https://deepmind.google", url_path) if url_path else ""
-                
-                # Extract date
-                date = datetime.datetime.now().strftime('%Y-%m-%d')  # Default to today
-                date_elem = item.find('time') or item.select_one('[class*="date"]')
-                if date_elem:
-                    date_text = date_elem.text.strip()
-                    # Try to parse the date
-                    try:
-                        date_formats = ['%d %B %Y', '%B %d, %Y', '%Y-%m-%d']
-                        for fmt in date_formats:
-                            try:
-                                parsed_date = datetime.datetime.strptime(date_text, fmt)
-                                date = parsed_date.strftime('%Y-%m-%d')
-                                break
-                            except ValueError:
-                                continue
-                    except Exception as e:
-                        logger.warning(f"Could not parse date '{date_text}': {e}")
-                
-                # Extract abstract
-                abstract = ""
-                abstract_elem = item.find('p') or item.select_one('[class*="description"], [class*="excerpt"]')
-                if abstract_elem and abstract_elem != title_elem:
-                    abstract = abstract_elem.text.strip()
-                
-                # Add entry using fallback
-                entries.append({
-                    'title': title,
-                    'url': full_url,
-                    'published': date,
-                    'abstract': abstract,
-                    'authors': "DeepMind",
-                    'source': 'deepmind_research'
-                })
-                logger.info(f"Found DeepMind publication (fallback): {title}")
+            _deepmind_fallback(fallback_items, entries, seen_titles, seen_urls, today_str)
         
         logger.info(f"Total DeepMind publications found: {len(entries)}")
         return entries
         
     except Exception as e:
-        logger.error(f"Error scraping DeepMind publications: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error scraping DeepMind publications: {e}")
         return entries
 
+# Checked in order: the first alternative found anywhere in the URL picks the scraper
+DISPATCH_RE = re.compile(
+    r'^(?:.*(?P<circuits>transformer-circuits\.pub)'
+    r'|.*(?P<anthropic>anthropic\.com/)'
+    r'|.*(?P<openai>openai\.com/research)'
+    r'|.*(?P<deepmind>deepmind))',
+    re.IGNORECASE
+)
+
+SCRAPERS = {
+    'circuits': scrape_circuits_research,
+    'anthropic': scrape_anthropic_research,
+    'openai': scrape_openai_research,
+    'deepmind': scrape_deepmind_research,
+}
+
+def get_blog_scraper(url):
+    """Return the specialized scraper for a blog URL."""
+    match = DISPATCH_RE.match(url)
+    if match is None:
+        raise ValueError(f"Unknown blog source: {url}")
+    return SCRAPERS[match.lastgroup]
+
+def _last_modified(url):
+    """Return the Last-Modified header from a HEAD request for url, or None if unavailable."""
+    # Not throttled: the HEAD is cheap and directly precedes the GET it may save
+    try:
+        response = _get_session().head(url, timeout=10, allow_redirects=True)
+    except requests.RequestException as e:
+        logger.warning(f"HEAD request for {url} failed: {e}")
+        return None
+    if response.status_code != 200:
+        return None
+    return response.headers.get('Last-Modified')
+
+# Guards the page cache shared by the scraper threads
+_PAGE_CACHE_LOCK = threading.Lock()
+
+def scrape_if_modified(url, scraper, page_cache):
+    """
+    Run scraper for url unless the page is unchanged since it was last scraped.
+    
+    Args:
+        url (str): Blog URL
+        scraper (callable): Scraper function for the URL
+        page_cache (dict): Mapping of URL to its last Last-Modified header and
+            entries; updated in place under _PAGE_CACHE_LOCK
+        
+    Returns:
+        list: Entries from the cache if the page is unchanged, otherwise freshly scraped
+    """
+    last_modified = _last_modified(url)
+    with _PAGE_CACHE_LOCK:
+        cached = page_cache.get(url)
+    if last_modified and cached and cached.get('last_modified') == last_modified:
+        logger.info(f"{url} unchanged since {last_modified}, reusing {len(cached['entries'])} cached entries")
+        return cached['entries']
+    
+    entries = scraper(url)
+    # Pages without Last-Modified can't be checked next time, and an empty result may be a failed scrape
+    if last_modified and entries:
+        with _PAGE_CACHE_LOCK:
+            page_cache[url] = {'last_modified': last_modified, 'entries': entries}
+    return entries
+
+def scrape_all(urls, max_workers=8, timeout=None):
+    """
+    Run blog scrapers concurrently.
+    
+    The scrapers are network-bound, so threads overlap their requests and the
+    total time is roughly that of the slowest site.
+    
+    Args:
+        urls (dict): Mapping of blog URL to the scraper function for it
+        max_workers (int): Maximum number of scrapers running at once
+        timeout (float): Seconds to wait for all scrapers; sites still running
+            after that contribute no entries. None waits for every site.
+            Sites whose scraper raises also contribute no entries.
+        
+    Returns:
+        dict: Mapping of blog URL to its scraped entries, in the order of `urls`
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls))))
+    # Pre-filled so sites that time out or fail are still present, in the order of `urls`
+    results = {url: [] for url in urls}
+    
+    def collect(future, url):
+        # One failing site must not discard the entries of the others
+        try:
+            results[url] = future.result()
+            logger.info(f"Scraped {len(results[url])} entries from {url}")
+        except Exception as e:
+            logger.exception(f"Error scraping {url}: {e}")
+    
+    try:
+        futures = {executor.submit(scraper, url): url for url, scraper in urls.items()}
+        pending = set(futures)
+        try:
+            # Handle each site as soon as it finishes rather than in submission order
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                collect(future, futures[future])
+        except FuturesTimeoutError:
+            for future in pending:
+                if future.done():
+                    collect(future, futures[future])
+                else:
+                    logger.error(f"Timed out after {timeout}s scraping {futures[future]}")
+        return results
+    finally:
+        # Don't block on scrapers that overran the deadline; their results are discarded
+        executor.shutdown(wait=False, cancel_futures=True)
+
 def scrape_blogs(start_date, end_date, max_entries=50, enable_keywords=False):
     """
     Scrape ML blogs for entries published between start_date and end_date.
@@ -729,13 +1051,10 @@ def scrape_blogs(start_date, end_date, max_entries=50, enable_keywords=False):
         list: List of dictionaries containing blog entries
     """
     try:
-        # Define base_dir
-        base_dir = Path(__file__).resolve().parents[2]
+        base_dir = _base_dir()
         
         # Load blog sources
-        sources_path = base_dir / "config" / "sources.json"
-        sources_config = load_config(sources_path)
-        blog_sources = sources_config.get('blogs', [])
+        blog_sources = _blog_sources()
         
         if not blog_sources:
             logger.error("No blog sources found in config")
@@ -744,65 +1063,60 @@ def scrape_blogs(start_date, end_date, max_entries=50, enable_keywords=False):
         logger.info(f"Found {len(blog_sources)} blog sources in config")
         
         # Load keywords
-        keywords_path = base_dir / "config" / "keywords.json"
-        keywords = load_config(keywords_path)
+        keywords = _keywords()
         
-        # Scrape each blog
-        all_entries = []
+        # Use specialized scrapers for known sites, skipping pages unchanged since the last run
+        page_cache = load_seen(_PAGE_CACHE_PATH)
+        scrapers = {}
         for blog_info in blog_sources:
             if 'url' not in blog_info or not blog_info['url']:
                 logger.warning(f"Skipping blog with no URL: {blog_info.get('name', 'Unknown')}")
                 continue
             
-            blog_entries = []
-            
-            # Use specialized scrapers for known sites
             url = blog_info['url'].lower()  # Use lowercase for consistent comparison
-            if 'transformer-circuits.pub' in url:
-                blog_entries = scrape_circuits_research(url)
-                logger.info(f"Used Transformer Circuits scraper for {url}")
-            elif 'anthropic.com/' in url:
-                blog_entries = scrape_anthropic_research(url)
-                logger.info(f"Used Anthropic scraper for {url}")
-            elif 'openai.com/research' in url:
-                blog_entries = scrape_openai_research(url)
-                logger.info(f"Used OpenAI scraper for {url}")
-            elif 'deepmind' in url:
-                blog_entries = scrape_deepmind_research(url)
-                logger.info(f"Used DeepMind scraper for {url}")
-            else:
-                raise ValueError(f"Unknown blog source: {url}")
-                #blog_entries = scrape_generic_blog(blog_info)
-                #logger.info(f"Used generic scraper for {url}")
-                
-            # Filter by keywords if needed
-            if enable_keywords:
-                if keywords:
-                    filtered_entries = [e for e in blog_entries if keyword_matches(e, keywords)]
-                    logger.info(f"Filtered from {len(blog_entries)} to {len(filtered_entries)} entries by keywords")
-                    blog_entries = filtered_entries
-            
-            blog_entries = [e for e in blog_entries if is_recent_publication(e, start_date, end_date)]
-            logger.info(f"Filtered to {len(blog_entries)} recent entries from {url}")
-
-            all_entries.extend(blog_entries)
-            
-            # Respect rate limits between different sites
-            time.sleep(2)
-            
-        logger.info(f"Total blog entries found: {len(all_entries)}")
+            scraper = get_blog_scraper(url)
+            logger.info(f"Using {scraper.__name__} for {url}")
+            scrapers[url] = partial(scrape_if_modified, scraper=scraper, page_cache=page_cache)
         
-        # Limit to max_entries
-        all_entries = all_entries[:max_entries]
+        # Scrape all blogs concurrently; they are independent hosts
+        scraped = scrape_all(scrapers, timeout=SCRAPE_TIMEOUT)
+        # Scrapers that overran the deadline may still be writing to page_cache, so save a snapshot
+        with _PAGE_CACHE_LOCK:
+            page_cache_snapshot = dict(page_cache)
+        save_seen(_PAGE_CACHE_PATH, page_cache_snapshot)
         
-        # Save raw data
+        # Save raw data as JSONL, one entry per line written as soon as it passes the filters
         raw_data_dir = base_dir / "data" / "raw"
         os.makedirs(raw_data_dir, exist_ok=True)
         
-        output_file = raw_data_dir / f"blogs_{start_date.strftime('%Y%m%d')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(all_entries, f, indent=2)
+        output_file = raw_data_dir / f"blogs_{start_date.strftime('%Y%m%d')}.jsonl"
+        all_entries = []
+        total_found = 0
+        with open(output_file, 'wb') as f:
+            for url, blog_entries in scraped.items():
+                # The date check is cheap and drops most entries, so run it before keyword matching
+                blog_entries = [e for e in blog_entries if is_recent_publication(e, start_date, end_date)]
+                logger.info(f"Filtered to {len(blog_entries)} recent entries from {url}")
+                
+                # Filter by keywords if needed
+                if enable_keywords:
+                    if keywords:
+                        filtered_entries = [e for e in blog_entries if keyword_matches(e, keywords)]
+                        logger.info(f"Filtered from {len(blog_entries)} to {len(filtered_entries)} entries by keywords")
+                        blog_entries = filtered_entries
+                total_found += len(blog_entries)
+                
+                # Limit to max_entries
+                for entry in blog_entries[:max(0, max_entries - len(all_entries))]:
+                    f.write(dumps_line(entry))
+                    all_entries.append(entry)
+                
+                # Once the cap is reached, the remaining sources need not be filtered at all
+                if len(all_entries) >= max_entries:
+                    logger.info(f"Reached max_entries ({max_entries}) after {url}")
+                    break
             
+        logger.info(f"Total blog entries found: {total_found}")
         logger.info(f"Saved {len(all_entries)} blog entries to {output_file}")
         
         return all_entries
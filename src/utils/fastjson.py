@@ -0,0 +1,29 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib json module."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj):
+    """Serialize obj to pretty-printed (2-space indented) UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def dumps_line(obj):
+    """Serialize obj to compact UTF-8 JSON bytes ending in a newline, i.e. one JSONL record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n'
+
+def loads(data):
+    """Deserialize JSON from bytes or str.
+
+    Both backends raise a subclass of json.JSONDecodeError on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,2 +1,32 @@
+import re
+
 def some_utility_function():
-    pass  # This function is intentionally left blank for future utility functions.
\ No newline at end of file
+    pass  # This function is intentionally left blank for future utility functions.
+
+def normalize_title(title):
+    """Lowercase a title and strip everything but letters and digits, for duplicate detection."""
+    return re.sub(r'\W+', '', title.lower())
+
+def dedupe_entries(entries):
+    """
+    Remove duplicate entries, keeping the first occurrence.
+    
+    Two entries are duplicates if they share a DOI or a normalized title. Checking
+    both catches preprints cross-posted to arXiv (no DOI) and bioRxiv (with DOI).
+    
+    Args:
+        entries (list): Entries from one or more sources
+        
+    Returns:
+        list: The entries without duplicates, in their original order
+    """
+    seen_keys = set()
+    unique_entries = []
+    for entry in entries:
+        keys = {('doi', entry.get('doi')), ('title', normalize_title(entry.get('title', '')))}
+        keys = {key for key in keys if key[1]}
+        is_duplicate = bool(keys & seen_keys)
+        seen_keys |= keys
+        if not is_duplicate:
+            unique_entries.append(entry)
+    return unique_entries